@@ -11,102 +11,103 @@ def take_optimal_action(grid, policy):
         return optimal_action
     return None
 
+map1 = {
+    "walls": [(0, 1), (1, 4), (4, 1), (4, 2), (4, 3)],
+    "rewards": {
+        (0, 0): 1, (0, 2): 1, (0, 5): 1, 
+        (1, 1): -1, (1, 3): 1, (1, 5): -1,          
+        (2, 2): -1, (2, 4): 1,                  
+        (3, 3): -1, (3, 5): 1,           
+        (4, 4): -1
+    },
+    "start_state": (3, 2),
+    "size": 6
+}
+# map2 = {
+#     "walls": [
+#         # Vertical wall sections
+#         *[(x, y) for x in range(3, 5) for y in [2, 7, 12]],
+#         *[(x, y) for x in range(8, 10) for y in [0, 5, 10, 14]],
+#         *[(x, y) for x in range(12, 14) for y in [3, 8, 13]],
+        
+#         # Horizontal wall sections
+#         *[(x, y) for y in range(6, 8) for x in [1, 6, 11, 14]],
+#         *[(x, y) for y in range(11, 13) for x in [0, 5, 10]],
+#         *[(x, y) for y in range(3, 5) for x in [7, 12]]
+#     ],
+#     "rewards": {
+#         # Positive rewards
+#         (0, 0): 1, (0, 14): 1, 
+#         (5, 5): 1, (5, 10): 1,
+#         (7, 7): 1, (7, 0): 1,
+#         (10, 14): 1, (10, 5): 1,
+#         (14, 0): 1, (14, 14): 1,
+        
+#         # Negative rewards
+#         (2, 2): -1, (2, 12): -1,
+#         (6, 6): -1, (6, 8): -1,
+#         (9, 9): -1, (9, 4): -1,
+#         (13, 13): -1, (13, 1): -1
+#     },
+#     "start_state": (7, 7),  # Near center of the map
+#     "size": 20
+# }
+
+# map2 = {
+#     "walls": [
+#         (0, 2), (0, 3), (1, 0), (1, 2), (1, 5),
+#         (2, 2), (2, 4), (3, 0), (3, 4),
+#         (4, 2), (4, 3), (5, 3), (5, 5),
+#         (2, 7), (2, 9), (7, 0), (8, 4),
+#         (4, 8), (4, 7), (7, 3), (9, 5),
+#         (9, 9), (8, 7), (7, 9)
+#     ],
+#     "rewards": {
+#         (0, 0): -1, (0, 5): 1, 
+#         (2, 1): -1, (2, 3): 1, 
+#         (3, 2): -1, (3, 5): 1,  
+#         (5, 0): 1,  (5, 4): -1, 
+#         (4, 1): -1, (1, 4): 1,
+#         (0, 8): 1,  (0, 9): -1,
+#         (1, 7): -1, (1, 9): 1,
+#         (3, 7): 1,  (3, 9): -1,
+#         (5, 8): -1, (5, 9): 1,
+#         (6, 2): 1,  (6, 5): -1,
+#         (7, 5): -1, (7, 7): 1,
+#         (8, 0): 1,  (8, 8): -1,
+#         (9, 2): -1, (9, 7): 1
+#     },
+#     "start_state": (5, 1),
+#     "size": 10
+# }
+map2 = {
+    "walls": [
+        (1, 1), (1, 14), (4, 4), (4, 9), (7, 0), (7, 14),
+        (9, 4), (9, 9), (12, 2), (12, 7), (14, 4), (14, 12)
+    ],
+    "rewards": {
+        (0, 0): 1, (0, 14): 1, 
+        (5, 5): 1, (5, 10): 1,
+        (7, 7): 1, (7, 12): 1,
+        (10, 0): 1, (10, 14): 1,
+        (14, 0): 1, (14, 14): 1,
+        
+        (2, 2): -1, (2, 12): -1,
+        (6, 6): -1, (6, 13): -1,
+        (9, 3): -1, (9, 10): -1,
+        (13, 5): -1, (13, 9): -1,
+        (4, 0): -1, (4, 14): -1,
+        (11, 2): -1, (11, 12): -1
+    },
+    "start_state": (7, 7), 
+    "size": 15,
+    "white_reward": -0.04, 
+    "discount": 0.95,     
+    "intended_prob": 0.8   
+}
+
 def main(stdscr):
     curses.curs_set(0)
-    map1 = {
-        "walls": [(0, 1), (1, 4), (4, 1), (4, 2), (4, 3)],
-        "rewards": {
-            (0, 0): 1, (0, 2): 1, (0, 5): 1, 
-            (1, 1): -1, (1, 3): 1, (1, 5): -1,          
-            (2, 2): -1, (2, 4): 1,                  
-            (3, 3): -1, (3, 5): 1,           
-            (4, 4): -1
-        },
-        "start_state": (3, 2),
-        "size": 6
-    }
-    # map2 = {
-    #     "walls": [
-    #         # Vertical wall sections
-    #         *[(x, y) for x in range(3, 5) for y in [2, 7, 12]],
-    #         *[(x, y) for x in range(8, 10) for y in [0, 5, 10, 14]],
-    #         *[(x, y) for x in range(12, 14) for y in [3, 8, 13]],
-            
-    #         # Horizontal wall sections
-    #         *[(x, y) for y in range(6, 8) for x in [1, 6, 11, 14]],
-    #         *[(x, y) for y in range(11, 13) for x in [0, 5, 10]],
-    #         *[(x, y) for y in range(3, 5) for x in [7, 12]]
-    #     ],
-    #     "rewards": {
-    #         # Positive rewards
-    #         (0, 0): 1, (0, 14): 1, 
-    #         (5, 5): 1, (5, 10): 1,
-    #         (7, 7): 1, (7, 0): 1,
-    #         (10, 14): 1, (10, 5): 1,
-    #         (14, 0): 1, (14, 14): 1,
-            
-    #         # Negative rewards
-    #         (2, 2): -1, (2, 12): -1,
-    #         (6, 6): -1, (6, 8): -1,
-    #         (9, 9): -1, (9, 4): -1,
-    #         (13, 13): -1, (13, 1): -1
-    #     },
-    #     "start_state": (7, 7),  # Near center of the map
-    #     "size": 20
-    # }
-    
-    # map2 = {
-    #     "walls": [
-    #         (0, 2), (0, 3), (1, 0), (1, 2), (1, 5),
-    #         (2, 2), (2, 4), (3, 0), (3, 4),
-    #         (4, 2), (4, 3), (5, 3), (5, 5),
-    #         (2, 7), (2, 9), (7, 0), (8, 4),
-    #         (4, 8), (4, 7), (7, 3), (9, 5),
-    #         (9, 9), (8, 7), (7, 9)
-    #     ],
-    #     "rewards": {
-    #         (0, 0): -1, (0, 5): 1, 
-    #         (2, 1): -1, (2, 3): 1, 
-    #         (3, 2): -1, (3, 5): 1,  
-    #         (5, 0): 1,  (5, 4): -1, 
-    #         (4, 1): -1, (1, 4): 1,
-    #         (0, 8): 1,  (0, 9): -1,
-    #         (1, 7): -1, (1, 9): 1,
-    #         (3, 7): 1,  (3, 9): -1,
-    #         (5, 8): -1, (5, 9): 1,
-    #         (6, 2): 1,  (6, 5): -1,
-    #         (7, 5): -1, (7, 7): 1,
-    #         (8, 0): 1,  (8, 8): -1,
-    #         (9, 2): -1, (9, 7): 1
-    #     },
-    #     "start_state": (5, 1),
-    #     "size": 10
-    # }
-    map2 = {
-        "walls": [
-            (1, 1), (1, 14), (4, 4), (4, 9), (7, 0), (7, 14),
-            (9, 4), (9, 9), (12, 2), (12, 7), (14, 4), (14, 12)
-        ],
-        "rewards": {
-            (0, 0): 1, (0, 14): 1, 
-            (5, 5): 1, (5, 10): 1,
-            (7, 7): 1, (7, 12): 1,
-            (10, 0): 1, (10, 14): 1,
-            (14, 0): 1, (14, 14): 1,
-            
-            (2, 2): -1, (2, 12): -1,
-            (6, 6): -1, (6, 13): -1,
-            (9, 3): -1, (9, 10): -1,
-            (13, 5): -1, (13, 9): -1,
-            (4, 0): -1, (4, 14): -1,
-            (11, 2): -1, (11, 12): -1
-        },
-        "start_state": (7, 7), 
-        "size": 15,
-        "white_reward": -0.04, 
-        "discount": 0.95,     
-        "intended_prob": 0.8   
-    }
     current_map = map1
     current_algorithm = "value"
     while True:
@@ -0,0 +1,252 @@
+import math
+import numpy as np
+
+def linear_schedule(start, end, duration):
+    """
+    Create a linearly decaying schedule for exploration or learning rates.
+
+    Parameters:
+    start (float): Value at step 0
+    end (float): Value reached once duration steps have elapsed
+    duration (int): Number of steps over which to decay from start to end
+
+    Returns:
+    Callable[[int], float]: Function mapping a step count to the scheduled value
+    """
+    def schedule(step):
+        fraction = min(step / max(duration, 1), 1.0)
+        return start + fraction * (end - start)
+    return schedule
+
+def exponential_schedule(start, end, decay):
+    """
+    Create an exponentially decaying schedule for exploration or learning rates.
+
+    Parameters:
+    start (float): Value at step 0
+    end (float): Lower bound the schedule decays towards
+    decay (float): Multiplicative decay applied per step, in (0, 1]
+
+    Returns:
+    Callable[[int], float]: Function mapping a step count to the scheduled value
+    """
+    def schedule(step):
+        return end + (start - end) * decay ** step
+    return schedule
+
+def wall_mask(Grid):
+    """
+    Mark the wall cells of the Grid in a boolean array.
+
+    Parameters:
+    Grid: The Grid object representing the MDP environment
+
+    Returns:
+    np.ndarray: (size, size) array that is True at every wall cell
+    """
+    is_wall = np.zeros((Grid.size, Grid.size), dtype=bool)
+    if Grid.walls:
+        rows, cols = zip(*Grid.walls)
+        is_wall[list(rows), list(cols)] = True
+    return is_wall
+
+def build_dynamics(Grid):
+    """
+    Convert the Grid into flat arrays for batched simulation.
+
+    States are indexed as row * size + column. The next-state table follows the
+    same rules as Grid.check_boundary and Grid.move_agent: a move into a wall or
+    off the grid leaves the agent where it is.
+
+    Parameters:
+    Grid: The Grid object representing the MDP environment
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        - next_state: (n_states, 4) next state for each state and actual move
+        - step_reward: (n_states,) reward received on arriving in a state
+        - cell_reward: (n_states,) R(s) as returned by Grid.get_reward
+        - open_states: indices of all non-wall states
+    """
+    size = Grid.size
+    n_states = size * size
+    is_wall = wall_mask(Grid)
+    rows, cols = np.divmod(np.arange(n_states), size)
+    next_state = np.empty((n_states, len(Grid.actions)), dtype=np.int64)
+    moves = {"UP": (-1, 0), "DOWN": (1, 0), "LEFT": (0, -1), "RIGHT": (0, 1)}
+    for a, action in enumerate(Grid.actions):
+        di, dj = moves[action]
+        ni, nj = rows + di, cols + dj
+        valid = (ni >= 0) & (ni < size) & (nj >= 0) & (nj < size)
+        valid[valid] = ~is_wall[ni[valid], nj[valid]]
+        next_state[:, a] = np.where(valid, ni * size + nj, np.arange(n_states))
+    step_reward = np.full(n_states, Grid.white_reward, dtype=np.float64)
+    cell_reward = np.zeros(n_states, dtype=np.float64)
+    for (i, j), value in Grid.rewards.items():
+        step_reward[i * size + j] = value
+        cell_reward[i * size + j] = Grid.get_reward(i, j)
+    open_states = np.flatnonzero(~is_wall.ravel())
+    return next_state, step_reward, cell_reward, open_states
+
+def q_learning(Grid, total_steps=8000, num_envs=2048, alpha=None, epsilon=None,
+               episode_length=10, double=True, seed=None, reference_policy=None, eval_every=1000):
+    """
+    Learn action values with batched tabular Q-learning on the Grid dynamics.
+
+    Steps num_envs environments in lockstep. The simulator is built from the
+    Grid's transition model (intended direction with Grid.intended_prob, each
+    perpendicular direction with the remainder split evenly), but the learner
+    only ever sees the sampled transitions and rewards. Each batch applies one
+    vectorised TD update; samples that hit the same (state, action) pair are
+    averaged rather than overwriting each other. The TD target mirrors the
+    backup used by value iteration, so the greedy policy approaches the one
+    returned by value_extract_policy as alpha and epsilon decay.
+
+    With discount close to 1, plain Q-learning overestimates values because the
+    max in its target picks up sampling noise, so double Q-learning is used by
+    default: each sample updates one of two tables, using the other to evaluate
+    the action the first one prefers. The defaults are still a finite budget:
+    on map2 a few states remain under-converged and pick a worse action than
+    value_extract_policy, losing up to about 0.5 utility.
+
+    Environments start in uniformly random open states and are restarted every
+    episode_length steps, since the grid has no terminal states. Short episodes
+    keep the samples spread over the map instead of piling up near rewards.
+
+    Parameters:
+    Grid: The Grid object representing the MDP environment
+    total_steps (int): Number of batched steps to run (default: 8000)
+    num_envs (int): Number of parallel environments (default: 2048)
+    alpha (float or Callable[[int], float]): Learning rate or schedule
+        (default: linear decay from 0.5 to 0.002 over total_steps)
+    epsilon (float or Callable[[int], float]): Exploration rate or schedule
+        (default: linear decay from 1.0 to 0.2 over total_steps)
+    episode_length (int): Steps before every environment is restarted (default: 10)
+    double (bool): Use double Q-learning instead of plain Q-learning (default: True)
+    seed (int): Seed for the random number generator (default: None)
+    reference_policy (Dict[Tuple[int,int], str]): Policy to compare against, e.g.
+        from value_extract_policy (default: None)
+    eval_every (int): Steps between agreement measurements (default: 1000)
+
+    Returns:
+    Tuple[np.ndarray, List[Tuple[int, float]]]:
+        - Q-table of shape (size, size, 4), ordered as Grid.actions (the mean
+          of both tables when double is True)
+        - (step, agreement) pairs recorded every eval_every steps, empty when
+          no reference_policy is given
+    """
+    if total_steps < 1 or num_envs < 1:
+        raise ValueError("total_steps and num_envs must be positive")
+    if episode_length < 1:
+        raise ValueError("episode_length must be positive")
+    if eval_every < 1:
+        raise ValueError("eval_every must be positive")
+    next_state, step_reward, cell_reward, open_states = build_dynamics(Grid)
+    if open_states.size == 0:
+        raise ValueError("Grid has no open states to start environments in")
+    if alpha is None:
+        alpha = linear_schedule(0.5, 0.002, total_steps)
+    if epsilon is None:
+        epsilon = linear_schedule(1.0, 0.2, total_steps)
+    rng = np.random.default_rng(seed)
+    alpha_schedule = alpha if callable(alpha) else (lambda step: alpha)
+    epsilon_schedule = epsilon if callable(epsilon) else (lambda step: epsilon)
+    n_states, n_actions = next_state.shape
+    # Actual move taken for each intended action: [intended, slip, slip]
+    perpendicular = {"UP": ("LEFT", "RIGHT"), "DOWN": ("LEFT", "RIGHT"),
+                     "LEFT": ("UP", "DOWN"), "RIGHT": ("UP", "DOWN")}
+    effects = np.array([[Grid.actions.index(action)] + [Grid.actions.index(p) for p in perpendicular[action]]
+                        for action in Grid.actions], dtype=np.int64)
+    slip_threshold = Grid.intended_prob + (1 - Grid.intended_prob) / 2
+    n_tables = 2 if double else 1
+    Q = np.zeros((n_tables, n_states, n_actions), dtype=np.float64)
+    Q_flat = Q.reshape(-1)
+    table_size = n_states * n_actions
+    action_offsets = np.arange(n_actions)
+    if reference_policy is not None:
+        reference_states = np.array([i * Grid.size + j for i, j in reference_policy], dtype=np.int64)
+        reference_actions = np.array([Grid.actions.index(a) for a in reference_policy.values()], dtype=np.int64)
+    states = rng.choice(open_states, size=num_envs)
+    history = []
+    for step in range(total_steps):
+        if step % episode_length == 0 and step > 0:
+            states = rng.choice(open_states, size=num_envs)
+        # Gather through flat indices with take(), which is much cheaper than fancy indexing
+        rows = (states * n_actions)[:, None] + action_offsets
+        Q_states = Q_flat.take(rows)
+        for t in range(1, n_tables):
+            Q_states += Q_flat.take(rows + t * table_size)
+        actions = Q_states.argmax(axis=1)
+        explore = rng.random(num_envs) < epsilon_schedule(step)
+        actions[explore] = rng.integers(n_actions, size=int(explore.sum()))
+        u = rng.random(num_envs)
+        outcome = (u >= Grid.intended_prob).astype(np.int64) + (u >= slip_threshold)
+        moves = effects.take(actions * effects.shape[1] + outcome)
+        new_states = next_state.take(states * n_actions + moves)
+        # Double Q-learning: the updated table picks a', the other table evaluates it
+        table = rng.integers(n_tables, size=num_envs) if double else np.zeros(num_envs, dtype=np.int64)
+        other = (table + 1) % n_tables
+        next_rows = new_states * n_actions
+        next_actions = Q_flat.take((table * table_size + next_rows)[:, None] + action_offsets).argmax(axis=1)
+        best_next = Q_flat.take(other * table_size + next_rows + next_actions)
+        # Q(s,a) <- r(s') + γ (R(s') + Q(s',a')), matching value_get_expected_discount_utility
+        targets = step_reward.take(new_states) + Grid.discount * (cell_reward.take(new_states) + best_next)
+        index = table * table_size + states * n_actions + actions
+        td_error = targets - Q_flat.take(index)
+        touched, inverse, counts = np.unique(index, return_inverse=True, return_counts=True)
+        Q_flat[touched] += alpha_schedule(step) * np.bincount(inverse, weights=td_error) / counts
+        states = new_states
+        if reference_policy is not None and (step + 1) % eval_every == 0:
+            greedy = Q.sum(axis=0).argmax(axis=1)
+            agreement = float(np.mean(greedy[reference_states] == reference_actions)) if reference_policy else math.nan
+            history.append((step + 1, agreement))
+    print(f"Q-learning finished after {total_steps} steps ({total_steps * num_envs} samples)")
+    return Q.mean(axis=0).reshape(Grid.size, Grid.size, n_actions), history
+
+def q_extract_policy(Grid, Q):
+    """
+    Extract the greedy policy from a learned Q-table.
+
+    Parameters:
+    Grid: The Grid object representing the MDP environment
+    Q (np.ndarray): Q-table of shape (size, size, 4) ordered as Grid.actions
+
+    Returns:
+    policy (Dict[Tuple[int,int], str]): Dictionary mapping states to greedy actions
+    """
+    best = Q.argmax(axis=2)
+    rows, columns = np.nonzero(~wall_mask(Grid))
+    return {(row, column): Grid.actions[best[row, column]]
+            for row, column in zip(rows.tolist(), columns.tolist())}
+
+def q_utilities(Grid, Q):
+    """
+    Convert a Q-table into utilities comparable with value_iteration.
+
+    Parameters:
+    Grid: The Grid object representing the MDP environment
+    Q (np.ndarray): Q-table of shape (size, size, 4) ordered as Grid.actions
+
+    Returns:
+    U (List[List[float]]): 2D array of utility values for each state (0 for walls)
+    """
+    _, _, cell_reward, _ = build_dynamics(Grid)
+    U = cell_reward.reshape(Grid.size, Grid.size) + Q.max(axis=2)
+    U[wall_mask(Grid)] = 0
+    return U.tolist()
+
+def policy_agreement(policy, reference_policy):
+    """
+    Compute the fraction of states where two policies choose the same action.
+
+    Parameters:
+    policy (Dict[Tuple[int,int], str]): Policy to evaluate
+    reference_policy (Dict[Tuple[int,int], str]): Policy to compare against
+
+    Returns:
+    float: Fraction of states in reference_policy with a matching action
+    """
+    if not reference_policy:
+        return math.nan
+    matches = sum(1 for state, action in reference_policy.items() if policy.get(state) == action)
+    return matches / len(reference_policy)
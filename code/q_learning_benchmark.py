@@ -0,0 +1,101 @@
+import random
+import time
+from main import map1, map2, create_grid
+from value_iteration import value_iteration, value_extract_policy
+from q_learning import q_learning, q_extract_policy, q_utilities, policy_agreement
+
+def benchmark(name, map_data, seed=0, min_agreement=0.9, max_utility_error=0.05):
+    """
+    Compare batched Q-learning against value iteration on one map.
+
+    Runs q_learning with a fixed seed, prints its learning curve, and checks the
+    final policy agreement and the relative utility error against the policy and
+    utilities from value_iteration.
+
+    Parameters:
+    name (str): Label printed alongside the results
+    map_data (Dict): Map definition in the format used by main.py
+    seed (int): Seed for the random number generator (default: 0)
+    min_agreement (float): Minimum fraction of matching actions (default: 0.9)
+    max_utility_error (float): Maximum relative utility error (default: 0.05)
+
+    Returns:
+    Tuple[float, float]: Final policy agreement and relative utility error
+    """
+    grid = create_grid(map_data)
+    U = value_iteration(grid)
+    reference_policy = value_extract_policy(grid, U)
+    start = time.perf_counter()
+    Q, history = q_learning(grid, seed=seed, reference_policy=reference_policy, eval_every=500)
+    elapsed = time.perf_counter() - start
+    agreement = policy_agreement(q_extract_policy(grid, Q), reference_policy)
+    Uq = q_utilities(grid, Q)
+    states = list(reference_policy)
+    utility_error = max(abs(Uq[i][j] - U[i][j]) for i, j in states) / max(abs(U[i][j]) for i, j in states)
+    print(f"{name}: {elapsed:.2f}s, agreement {agreement:.3f}, relative utility error {utility_error:.4f}")
+    for step, value in history:
+        print(f"  step {step}: agreement {value:.3f}")
+    assert agreement >= min_agreement, f"{name}: agreement {agreement:.3f} below {min_agreement}"
+    assert utility_error <= max_utility_error, f"{name}: utility error {utility_error:.4f} above {max_utility_error}"
+    return agreement, utility_error
+
+def random_map(size, n_walls, n_rewards, seed=0):
+    """
+    Generate a reproducible map with randomly placed walls and +1/-1 rewards.
+
+    Parameters:
+    size (int): Width and height of the grid
+    n_walls (int): Number of wall cells to place (duplicates are merged)
+    n_rewards (int): Number of reward cells to place (duplicates are merged)
+    seed (int): Seed for the random number generator (default: 0)
+
+    Returns:
+    Dict: Map definition in the format used by main.py
+    """
+    rng = random.Random(seed)
+    walls = sorted({(rng.randrange(size), rng.randrange(size)) for _ in range(n_walls)})
+    wall_set = set(walls)
+    rewards = {}
+    for _ in range(n_rewards):
+        cell = (rng.randrange(size), rng.randrange(size))
+        if cell not in wall_set:
+            rewards[cell] = rng.choice([1, -1])
+    open_cells = [(i, j) for i in range(size) for j in range(size) if (i, j) not in wall_set]
+    return {"walls": walls, "rewards": rewards, "start_state": open_cells[0], "size": size}
+
+def benchmark_throughput(name, map_data, seed=0, eval_every=100, max_seconds=10.0):
+    """
+    Time a Q-learning run with learning-curve evaluation on a large map.
+
+    Value iteration is too slow to serve as the reference here, so the greedy
+    policy of a run with another seed is used instead; the curve then shows how
+    consistently independent runs settle on the same policy.
+
+    Parameters:
+    name (str): Label printed alongside the results
+    map_data (Dict): Map definition in the format used by main.py
+    seed (int): Seed for the timed run (default: 0)
+    eval_every (int): Steps between agreement measurements (default: 100)
+    max_seconds (float): Maximum wall-clock time for the timed run (default: 10.0)
+
+    Returns:
+    Tuple[float, List[Tuple[int, float]]]: Elapsed seconds and the learning curve
+    """
+    grid = create_grid(map_data)
+    Q, _ = q_learning(grid, seed=seed + 1)
+    reference_policy = q_extract_policy(grid, Q)
+    start = time.perf_counter()
+    Q, history = q_learning(grid, seed=seed, reference_policy=reference_policy, eval_every=eval_every)
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed:.2f}s, {len(history)} evaluations, final agreement {history[-1][1]:.3f}")
+    assert elapsed <= max_seconds, f"{name}: took {elapsed:.2f}s, above {max_seconds}s"
+    assert [step for step, _ in history] == list(range(eval_every, len(history) * eval_every + 1, eval_every))
+    assert all(0 <= value <= 1 for _, value in history)
+    return elapsed, history
+
+if __name__ == "__main__":
+    benchmark("Map 1", map1)
+    # A few states on map 2 are still under-converged with the default budget
+    # and pick a worse action than value iteration, hence not 1.0
+    benchmark("Map 2", map2, min_agreement=0.9)
+    benchmark_throughput("Random 100x100", random_map(100, n_walls=2000, n_rewards=300))